@@ -21,6 +21,7 @@ import json
 import importlib
 import logging
 import multiprocessing as mp
+from collections import OrderedDict
 
 from lithops import constants
 from lithops.version import __version__
@@ -35,16 +36,37 @@ os.makedirs(constants.LOGS_DIR, exist_ok=True)
 
 CPU_COUNT = mp.cpu_count()
 
+YAML_CACHE_SIZE = 100
+_yaml_cache = OrderedDict()
+
 
 def load_yaml_config(config_filename):
+    """
+    Loads a yaml config file. Parsed files are cached by path, mtime
+    and size, so the file is only parsed again when it changes on disk
+    """
     import yaml
     try:
-        with open(config_filename, 'r') as config_file:
-            data = yaml.safe_load(config_file)
+        stat = os.stat(config_filename)
     except FileNotFoundError:
-        data = {}
+        return {}
 
-    return data
+    cache_key = (os.path.abspath(config_filename), stat.st_mtime_ns, stat.st_size)
+
+    if cache_key in _yaml_cache:
+        _yaml_cache.move_to_end(cache_key)
+    else:
+        try:
+            with open(config_filename, 'r') as config_file:
+                data = yaml.safe_load(config_file)
+        except FileNotFoundError:
+            return {}
+        _yaml_cache[cache_key] = data
+        if len(_yaml_cache) > YAML_CACHE_SIZE:
+            _yaml_cache.popitem(last=False)
+
+    # Return a copy so callers can't modify the cached data
+    return copy.deepcopy(_yaml_cache[cache_key])
 
 
 def dump_yaml_config(config_filename, data):
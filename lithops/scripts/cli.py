@@ -16,15 +16,21 @@
 
 
 import os
+import sys
+import json
 import time
 import click
 import logging
 import shutil
+import select
+import subprocess as sp
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import lithops
 from lithops import Storage
-from lithops.tests.tests_main import print_test_functions, print_test_groups, run_tests
-from lithops.utils import get_mode, setup_lithops_logger, verify_runtime_name, sizeof_fmt
+from lithops.utils import get_mode, setup_lithops_logger, verify_runtime_name, \
+    sizeof_fmt, is_unix_system
 from lithops.config import default_config, extract_storage_config, \
     extract_serverless_config, extract_standalone_config, \
     extract_localhost_config, load_yaml_config
@@ -39,6 +45,11 @@ from lithops.localhost.localhost import LocalhostHandler
 
 logger = logging.getLogger(__name__)
 
+COPY_BUFFER_SIZE = 16 * 1024 * 1024
+
+# inotify events: IN_MODIFY | IN_ATTRIB | IN_DELETE_SELF | IN_MOVE_SELF
+INOTIFY_MASK = 0x00000002 | 0x00000004 | 0x00000400 | 0x00000800
+
 
 def set_config_ow(backend, storage=None):
     config_ow = {'lithops': {}}
@@ -51,6 +62,68 @@ def set_config_ow(backend, storage=None):
     return config_ow
 
 
+def _fast_rmtree(path):
+    """
+    Removes a directory tree. On unix systems it relies on 'rm -rf', which
+    is much faster than shutil.rmtree() for trees with many small files
+    """
+    if is_unix_system():
+        try:
+            sp.run(['rm', '-rf', path], check=True,
+                   stdout=sp.DEVNULL, stderr=sp.DEVNULL)
+            return
+        except Exception:
+            pass
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _inotify_watch(path):
+    """
+    Returns a non-blocking inotify file descriptor that becomes readable when
+    the file in path changes, or None if inotify is not available
+    """
+    import ctypes
+    import ctypes.util
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        watch_fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if watch_fd < 0:
+        return None
+    if libc.inotify_add_watch(watch_fd, os.fsencode(path), INOTIFY_MASK) < 0:
+        os.close(watch_fd)
+        return None
+    return watch_fd
+
+
+@lru_cache(maxsize=8)
+def _create_internal_storage(storage_config_json):
+    return InternalStorage(json.loads(storage_config_json))
+
+
+@lru_cache(maxsize=8)
+def _create_serverless_handler(compute_config_json, internal_storage):
+    return ServerlessHandler(json.loads(compute_config_json), internal_storage)
+
+
+def _get_internal_storage(storage_config):
+    """
+    Returns an InternalStorage instance, reusing a previously created one
+    for the same storage config
+    """
+    return _create_internal_storage(json.dumps(storage_config, sort_keys=True))
+
+
+def _get_serverless_handler(compute_config, internal_storage):
+    """
+    Returns a ServerlessHandler instance, reusing a previously created one
+    for the same compute config and internal storage
+    """
+    return _create_serverless_handler(json.dumps(compute_config, sort_keys=True),
+                                      internal_storage)
+
+
 @click.group('lithops_cli')
 @click.version_option()
 def lithops_cli():
@@ -73,7 +146,7 @@ def clean(config, backend, storage, debug):
     config_ow = set_config_ow(backend, storage)
     config = default_config(config, config_ow)
     storage_config = extract_storage_config(config)
-    internal_storage = InternalStorage(storage_config)
+    internal_storage = _get_internal_storage(storage_config)
 
     backend = config['lithops']['backend']
     if backend == LOCALHOST:
@@ -81,22 +154,28 @@ def clean(config, backend, storage, debug):
         compute_handler = LocalhostHandler(compute_config)
     elif backend in SERVERLESS_BACKENDS:
         compute_config = extract_serverless_config(config)
-        compute_handler = ServerlessHandler(compute_config, internal_storage)
+        compute_handler = _get_serverless_handler(compute_config, internal_storage)
     elif backend == STANDALONE_BACKENDS:
         compute_config = extract_standalone_config(config)
         compute_handler = StandaloneHandler(compute_config)
 
     compute_handler.clean()
 
-    # Clean object storage temp dirs
     storage = internal_storage.storage
-    clean_bucket(storage, storage_config['bucket'], RUNTIMES_PREFIX, sleep=1)
-    clean_bucket(storage, storage_config['bucket'], JOBS_PREFIX, sleep=1)
-
-    # Clean localhost executor temp dirs
-    shutil.rmtree(LITHOPS_TEMP_DIR, ignore_errors=True)
-    # Clean local lithops cache
-    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    bucket = storage_config['bucket']
+
+    with ThreadPoolExecutor(4) as ex:
+        fs = [
+            # Clean object storage temp dirs
+            ex.submit(clean_bucket, storage, bucket, RUNTIMES_PREFIX, sleep=0),
+            ex.submit(clean_bucket, storage, bucket, JOBS_PREFIX, sleep=0),
+            # Clean localhost executor temp dirs
+            ex.submit(_fast_rmtree, LITHOPS_TEMP_DIR),
+            # Clean local lithops cache
+            ex.submit(_fast_rmtree, CACHE_DIR)
+        ]
+        for f in as_completed(fs):
+            f.result()
 
 
 @lithops_cli.command('verify')
@@ -114,11 +193,7 @@ def clean(config, backend, storage, debug):
 @click.option('--keep_datasets', '-k', is_flag=True, help='keeps datasets in storage after the test run. '
                                                           'Meant to serve some use-cases in github workflow.')
 def test(test, config, backend, groups, storage, debug, fail_fast, keep_datasets):
-    if config:
-        config = load_yaml_config(config)
-
-    log_level = logging.INFO if not debug else logging.DEBUG
-    setup_lithops_logger(log_level)
+    from lithops.tests.tests_main import print_test_functions, print_test_groups, run_tests
 
     if groups and test == 'all':  # if user specified a group(s) avoid running all tests.
         test = ''
@@ -129,6 +204,12 @@ def test(test, config, backend, groups, storage, debug, fail_fast, keep_datasets
         print_test_groups()
 
     else:
+        if config:
+            config = load_yaml_config(config)
+
+        log_level = logging.INFO if not debug else logging.DEBUG
+        setup_lithops_logger(log_level)
+
         run_tests(test, config, groups, backend, storage, fail_fast, keep_datasets)
 
 
@@ -203,7 +284,7 @@ def get_object(bucket, key, backend, debug):
     logger.info('Downloading object {} from bucket {}'.format(key, bucket))
     data_stream = storage.get_object(bucket, key, stream=True)
     with open(key, 'wb') as out:
-        shutil.copyfileobj(data_stream, out)
+        shutil.copyfileobj(data_stream, out, COPY_BUFFER_SIZE)
     logger.info('Object downloaded successfully')
 
 
@@ -256,16 +337,18 @@ def list_bucket(prefix, bucket, backend, debug):
     logger.info('Listing objects in bucket {}'.format(bucket))
     objects = storage.list_objects(bucket, prefix=prefix)
 
-    width = max([len(obj['Key']) for obj in objects])
-
-    print('\n{:{width}} \t {} \t\t {:>9}'.format('Key', 'Last modified', 'Size', width=width))
-    print('-' * width, '\t', '-' * 20, '\t', '-' * 9)
+    width = 0
+    rows = []
     for obj in objects:
         key = obj['Key']
-        date = obj['LastModified'].strftime("%b %d %Y %H:%M:%S")
-        size = sizeof_fmt(obj['Size'])
-        print('{:{width}} \t {} \t {:>9}'.format(key, date, size, width=width))
-    print()
+        width = max(width, len(key))
+        rows.append((key, obj['LastModified'].strftime("%b %d %Y %H:%M:%S"), sizeof_fmt(obj['Size'])))
+
+    lines = ['\n{:{width}} \t {} \t\t {:>9}'.format('Key', 'Last modified', 'Size', width=width),
+             '{} \t {} \t {}'.format('-' * width, '-' * 20, '-' * 9)]
+    lines.extend('{:{width}} \t {} \t {:>9}'.format(key, date, size, width=width)
+                 for key, date, size in rows)
+    sys.stdout.write('\n'.join(lines) + '\n\n')
 
 
 # /---------------------------------------------------------------------------/
@@ -284,24 +367,44 @@ def logs(ctx):
 def poll():
     logging.basicConfig(level=logging.DEBUG)
 
-    def follow(file):
-        line = ''
-        while True:
-            if not os.path.isfile(FN_LOG_FILE):
-                break
-            tmp = file.readline()
-            if tmp:
-                line += tmp
-                if line.endswith("\n"):
-                    yield line
-                    line = ''
-            else:
-                time.sleep(1)
-
+    def follow(log_fd, from_end):
+        watch_fd = _inotify_watch(FN_LOG_FILE)
+        try:
+            if from_end:
+                # Only print new log lines, like 'tail -F'
+                os.lseek(log_fd, 0, os.SEEK_END)
+            while True:
+                if not os.path.isfile(FN_LOG_FILE):
+                    break
+                chunk = os.read(log_fd, 65536)
+                if chunk:
+                    yield chunk
+                elif watch_fd is not None:
+                    # Sleep until the file changes, checking every
+                    # second that it still exists
+                    select.select([watch_fd], [], [], 1)
+                    try:
+                        os.read(watch_fd, 4096)
+                    except BlockingIOError:
+                        pass
+                else:
+                    time.sleep(1)
+        finally:
+            if watch_fd is not None:
+                os.close(watch_fd)
+
+    # A recreated log file is read from the start
+    first_open = True
     while True:
         if os.path.isfile(FN_LOG_FILE):
-            for line in follow(open(FN_LOG_FILE, 'r')):
-                print(line, end='')
+            log_fd = os.open(FN_LOG_FILE, os.O_RDONLY)
+            try:
+                for chunk in follow(log_fd, first_open):
+                    sys.stdout.buffer.write(chunk)
+                    sys.stdout.buffer.flush()
+            finally:
+                os.close(log_fd)
+            first_open = False
         else:
             time.sleep(1)
 
@@ -356,10 +459,10 @@ def create(name, storage, backend, memory, timeout, config):
 
     logger.info('Creating new lithops runtime: {}'.format(name))
     storage_config = extract_storage_config(config)
-    internal_storage = InternalStorage(storage_config)
+    internal_storage = _get_internal_storage(storage_config)
 
     compute_config = extract_serverless_config(config)
-    compute_handler = ServerlessHandler(compute_config, internal_storage)
+    compute_handler = _get_serverless_handler(compute_config, internal_storage)
     mem = memory if memory else compute_config['runtime_memory']
     to = timeout if timeout else compute_config['runtime_timeout']
     runtime_key = compute_handler.get_runtime_key(name, mem)
@@ -393,10 +496,10 @@ def build(name, file, config, backend):
     verify_runtime_name(name)
 
     storage_config = extract_storage_config(config)
-    internal_storage = InternalStorage(storage_config)
+    internal_storage = _get_internal_storage(storage_config)
 
     compute_config = extract_serverless_config(config)
-    compute_handler = ServerlessHandler(compute_config, internal_storage)
+    compute_handler = _get_serverless_handler(compute_config, internal_storage)
     compute_handler.build_runtime(name, file)
 
 
@@ -422,9 +525,9 @@ def update(name, config, backend, storage):
     verify_runtime_name(name)
 
     storage_config = extract_storage_config(config)
-    internal_storage = InternalStorage(storage_config)
+    internal_storage = _get_internal_storage(storage_config)
     compute_config = extract_serverless_config(config)
-    compute_handler = ServerlessHandler(compute_config, internal_storage)
+    compute_handler = _get_serverless_handler(compute_config, internal_storage)
 
     timeout = compute_config['runtime_memory']
     logger.info('Updating runtime: {}'.format(name))
@@ -463,15 +566,19 @@ def delete(name, config, backend, storage):
     verify_runtime_name(name)
 
     storage_config = extract_storage_config(config)
-    internal_storage = InternalStorage(storage_config)
+    internal_storage = _get_internal_storage(storage_config)
     compute_config = extract_serverless_config(config)
-    compute_handler = ServerlessHandler(compute_config, internal_storage)
+    compute_handler = _get_serverless_handler(compute_config, internal_storage)
 
     runtimes = compute_handler.list_runtimes(name)
-    for runtime in runtimes:
-        compute_handler.delete_runtime(runtime[0], runtime[1])
-        runtime_key = compute_handler.get_runtime_key(runtime[0], runtime[1])
-        internal_storage.delete_runtime_meta(runtime_key)
+    runtime_keys = []
+    try:
+        for runtime in runtimes:
+            compute_handler.delete_runtime(runtime[0], runtime[1])
+            runtime_keys.append(compute_handler.get_runtime_key(runtime[0], runtime[1]))
+    finally:
+        # Delete the metadata of the deleted runtimes in a single batch
+        internal_storage.delete_runtime_metas(runtime_keys)
 
 
 lithops_cli.add_command(runtime)
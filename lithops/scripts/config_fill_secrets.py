@@ -1,4 +1,5 @@
 import os
+import re
 import sys
 
 
@@ -19,8 +20,10 @@ if __name__ == '__main__':
     with open(config_file, 'r') as file:
         filedata = file.read()
 
-    for i, arg in enumerate(args):
-        filedata = filedata.replace(secrets_to_fill[i], arg)
+    secrets = dict(zip(secrets_to_fill, args))
+    if secrets:
+        pattern = re.compile('|'.join(re.escape(secret) for secret in secrets))
+        filedata = pattern.sub(lambda match: secrets[match.group(0)], filedata)
 
     with open(config_file, 'w') as file:
         file.write(filedata)
@@ -288,6 +288,17 @@ class InternalStorage:
         except StorageNoSuchKeyError:
             return None
 
+    def _runtime_meta_paths(self, key):
+        """
+        Get the storage key and the local cache path of a runtime metadata.
+        :param key: runtime key
+        :return: object key and local cache path
+        """
+        path = [RUNTIMES_PREFIX, __version__, key+".meta.json"]
+        obj_key = '/'.join(path).replace('\\', '/')
+        filename_local_path = os.path.join(CACHE_DIR, *path)
+        return obj_key, filename_local_path
+
     def get_runtime_meta(self, key):
         """
         Get the metadata given a runtime name.
@@ -295,8 +306,7 @@ class InternalStorage:
         :return: runtime metadata
         """
 
-        path = [RUNTIMES_PREFIX, __version__,  key+".meta.json"]
-        filename_local_path = os.path.join(CACHE_DIR, *path)
+        obj_key, filename_local_path = self._runtime_meta_paths(key)
 
         if not is_lithops_worker() and os.path.exists(filename_local_path):
             logger.debug("Runtime metadata found in local cache")
@@ -306,7 +316,6 @@ class InternalStorage:
         else:
             logger.debug("Runtime metadata not found in local cache. Retrieving it from storage")
             try:
-                obj_key = '/'.join(path).replace('\\', '/')
                 logger.debug('Trying to download runtime metadata from: {}://{}/{}'
                              .format(self.backend, self.bucket, obj_key))
                 json_str = self.storage.get_object(self.bucket, obj_key)
@@ -334,14 +343,12 @@ class InternalStorage:
         :param runtime: name of the runtime
         :param runtime_meta metadata
         """
-        path = [RUNTIMES_PREFIX, __version__,  key+".meta.json"]
-        obj_key = '/'.join(path).replace('\\', '/')
+        obj_key, filename_local_path = self._runtime_meta_paths(key)
         logger.debug("Uploading runtime metadata to: {}://{}/{}"
                      .format(self.backend, self.bucket, obj_key))
         self.storage.put_object(self.bucket, obj_key, json.dumps(runtime_meta))
 
         if not is_lithops_worker():
-            filename_local_path = os.path.join(CACHE_DIR, *path)
             logger.debug("Storing runtime metadata into local cache: {}".format(filename_local_path))
 
             if not os.path.exists(os.path.dirname(filename_local_path)):
@@ -356,9 +363,21 @@ class InternalStorage:
         :param runtime: name of the runtime
         :param runtime_meta metadata
         """
-        path = [RUNTIMES_PREFIX, __version__,  key+".meta.json"]
-        obj_key = '/'.join(path).replace('\\', '/')
-        filename_local_path = os.path.join(CACHE_DIR, *path)
+        obj_key, filename_local_path = self._runtime_meta_paths(key)
         if os.path.exists(filename_local_path):
             os.remove(filename_local_path)
         self.storage.delete_object(self.bucket, obj_key)
+
+    def delete_runtime_metas(self, keys):
+        """
+        Deletes the metadata of multiple runtimes in a single batch request.
+        :param keys: list of runtime keys
+        """
+        obj_keys = []
+        for key in keys:
+            obj_key, filename_local_path = self._runtime_meta_paths(key)
+            obj_keys.append(obj_key)
+            if os.path.exists(filename_local_path):
+                os.remove(filename_local_path)
+        if obj_keys:
+            self.storage.delete_objects(self.bucket, obj_keys)
@@ -18,17 +18,20 @@
 
 import os
 import sys
+import ast
 import zlib
 import time
 import json
 import queue
+import signal
 import base64
 import pickle
 import logging
 import traceback
 import multiprocessing as mp
-from threading import Thread
-from multiprocessing import Process, Pipe
+import multiprocessing.util
+from threading import Thread, current_thread, main_thread
+from multiprocessing import Pipe
 from multiprocessing.managers import SyncManager
 from tblib import pickling_support
 from types import SimpleNamespace
@@ -47,6 +50,15 @@ pickling_support.install()
 
 logger = logging.getLogger(__name__)
 
+# Last serialized config, reused by warm containers that keep
+# receiving the same lithops config
+_config_json_cache = (None, None)
+
+
+class ExecutionTimeout(Exception):
+    """Raised by the SIGALRM handler when the execution timeout expires"""
+    pass
+
 
 class ShutdownSentinel:
     """Put an instance of this class on the queue to shut it down"""
@@ -146,7 +158,7 @@ def run_job(job, internal_storage):
     env = job.extra_env
     env['LITHOPS_WORKER'] = 'True'
     env['PYTHONUNBUFFERED'] = 'True'
-    env['LITHOPS_CONFIG'] = json.dumps(job.config)
+    env['LITHOPS_CONFIG'] = dump_config(job.config)
     env['__LITHOPS_SESSION_ID'] = '-'.join([job.job_key, job.id])
     os.environ.update(env)
 
@@ -158,24 +170,38 @@ def run_job(job, internal_storage):
         handler_conn, jobrunner_conn = Pipe()
         taskrunner = JobRunner(job, jobrunner_conn, internal_storage)
         logger.debug('Starting JobRunner process')
-        jrp = Process(target=taskrunner.run) if is_unix_system() else Thread(target=taskrunner.run)
-        jrp.start()
 
-        jrp.join(job.execution_timeout)
+        if is_unix_system():
+            jrp_pid = os.fork()
+            if jrp_pid == 0:
+                run_forked(taskrunner.run)
+            # Close the write end in this process, so that the pipe
+            # reaches EOF as soon as the JobRunner process exits
+            jobrunner_conn.close()
+
+            if not wait_forked(jrp_pid, handler_conn, job.execution_timeout):
+                # If process is still alive after the execution timeout, kill it
+                try:
+                    os.kill(jrp_pid, signal.SIGKILL)
+                    os.waitpid(jrp_pid, 0)
+                except (ProcessLookupError, ChildProcessError):
+                    pass
+                msg = ('Function exceeded maximum time of {} seconds and was '
+                       'killed'.format(job.execution_timeout))
+                raise TimeoutError('HANDLER', msg)
+        else:
+            jrp = Thread(target=taskrunner.run)
+            jrp.start()
+            jrp.join(job.execution_timeout)
+
+            if jrp.is_alive():
+                msg = ('Function exceeded maximum time of {} seconds and was '
+                       'killed'.format(job.execution_timeout))
+                raise TimeoutError('HANDLER', msg)
+
         logger.debug('JobRunner process finished')
 
-        if jrp.is_alive():
-            # If process is still alive after jr.join(job_max_runtime), kill it
-            try:
-                jrp.terminate()
-            except Exception:
-                # thread does not have terminate method
-                pass
-            msg = ('Function exceeded maximum time of {} seconds and was '
-                   'killed'.format(job.execution_timeout))
-            raise TimeoutError('HANDLER', msg)
-
-        if not handler_conn.poll():
+        if not jobrunner_finished(handler_conn):
             logger.error('No completion message received from JobRunner process')
             logger.debug('Assuming memory overflow...')
             # Only 1 message is returned by jobrunner when it finishes.
@@ -193,7 +219,7 @@ def run_job(job, internal_storage):
                     except Exception:
                         call_status.add(key, value)
                     if key in ['exception', 'exc_pickle_fail', 'result']:
-                        call_status.add(key, eval(value))
+                        call_status.add(key, ast.literal_eval(value))
 
     except Exception:
         # internal runtime exceptions
@@ -203,7 +229,6 @@ def run_job(job, internal_storage):
         call_status.add('exception', True)
 
         pickled_exc = pickle.dumps(sys.exc_info())
-        pickle.loads(pickled_exc)  # this is just to make sure they can be unpickled
         call_status.add('exc_info', str(pickled_exc))
 
     finally:
@@ -223,3 +248,82 @@ def run_job(job, internal_storage):
         os.environ.pop('__LITHOPS_TOTAL_EXECUTORS', None)
 
         logger.info("Finished")
+
+
+def dump_config(config):
+    """
+    Returns the json representation of the config, reusing the last
+    one if the config did not change
+    """
+    global _config_json_cache
+    cached_config, config_json = _config_json_cache
+    if cached_config != config:
+        config_json = json.dumps(config)
+        # The config arrives as json, so loading it back is an exact copy
+        _config_json_cache = (json.loads(config_json), config_json)
+    return config_json
+
+
+def run_forked(target):
+    """
+    Runs the target function within a forked process and exits
+    the process without returning to the caller
+    """
+    exit_code = 0
+    try:
+        target()
+    except BaseException:
+        traceback.print_exc(file=sys.stdout)
+        exit_code = 1
+    finally:
+        # Terminate daemonic children started by the function, as
+        # multiprocessing.Process does when its target finishes
+        mp.util._exit_function()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+
+def wait_forked(pid, handler_conn, timeout):
+    """
+    Waits until the forked JobRunner process exits. Returns False
+    if it is still running after the timeout
+    """
+    if current_thread() is main_thread():
+        # Sleep in the kernel until the process exits or the alarm fires
+        def alarm_handler(signum, frame):
+            raise ExecutionTimeout()
+
+        old_handler = signal.signal(signal.SIGALRM, alarm_handler)
+        try:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+            os.waitpid(pid, 0)
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            return True
+        except ExecutionTimeout:
+            # The alarm can fire right after waitpid() returned, so
+            # check if the process was already reaped before giving up
+            try:
+                return os.waitpid(pid, os.WNOHANG)[0] != 0
+            except ChildProcessError:
+                return True
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, old_handler)
+
+    # Signal handlers can only be set from the main thread,
+    # so wait for the pipe to be closed instead
+    if not handler_conn.poll(timeout):
+        return False
+    os.waitpid(pid, 0)
+    return True
+
+
+def jobrunner_finished(handler_conn):
+    """
+    Checks if the JobRunner sent its completion message
+    """
+    try:
+        return handler_conn.poll() and handler_conn.recv() is not None
+    except EOFError:
+        return False
@@ -11,7 +11,7 @@ from lithops.storage.utils import create_status_key, create_job_key,\
     create_init_key
 from lithops.constants import JOBS_PREFIX
 from distutils.util import strtobool
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 pickling_support.install()
 
@@ -81,11 +81,19 @@ class StorageCallStatus(CallStatus):
             self.internal_storage.put_data(init_key, '')
 
         elif self.status['type'] == '__end__':
-            status_key = create_status_key(JOBS_PREFIX, executor_id, job_id, call_id)
-            dmpd_response_status = json.dumps(self.status)
-            drs = sizeof_fmt(len(dmpd_response_status))
-            logger.info("Storing execution stats - Size: {}".format(drs))
-            self.internal_storage.put_data(status_key, dmpd_response_status)
+            self._store_status(json.dumps(self.status))
+
+    def _store_status(self, dmpd_response_status):
+        """
+        Stores the serialized finish status into the Object Storage
+        """
+        executor_id = self.status['executor_id']
+        job_id = self.status['job_id']
+        call_id = self.status['call_id']
+        status_key = create_status_key(JOBS_PREFIX, executor_id, job_id, call_id)
+        drs = sizeof_fmt(len(dmpd_response_status))
+        logger.info("Storing execution stats - Size: {}".format(drs))
+        self.internal_storage.put_data(status_key, dmpd_response_status)
 
 
 class RabbitmqCallStatus(StorageCallStatus):
@@ -95,25 +103,37 @@ class RabbitmqCallStatus(StorageCallStatus):
 
         rabbit_amqp_url = self.config['rabbitmq'].get('amqp_url')
         self.pikaparams = pika.URLParameters(rabbit_amqp_url)
+        self.connection = None
+        self.channel = None
 
-    @contextmanager
-    def _create_channel(self):
+    def _get_channel(self):
+        """
+        Returns a rabbitmq channel, (re)connecting only if needed
+        """
+        if self.connection is None or self.connection.is_closed:
+            self.connection = pika.BlockingConnection(self.pikaparams)
+            self.channel = None
+        if self.channel is None or self.channel.is_closed:
+            self.channel = self.connection.channel()
+        return self.channel
+
+    def _close_connection(self):
         """
-        Creates a rabbitmq channel
+        Closes the rabbitmq connection, if any
         """
-        self.connection = pika.BlockingConnection(self.pikaparams)
-        self.channel = self.connection.channel()
         try:
-            yield self.channel
-        finally:
-            self.channel.close()
-            self.connection.close()
-
-    def _send(self):
+            if self.connection is not None and self.connection.is_open:
+                self.connection.close()
+        except Exception:
+            pass
+        self.connection = None
+        self.channel = None
+
+    def _publish(self, dmpd_response_status):
         """
-        Send the status event to RabbitMQ
+        Publishes the serialized status to the job queues. The connection
+        is opened once and reused across the publish retries
         """
-        dmpd_response_status = json.dumps(self.status)
         drs = sizeof_fmt(len(dmpd_response_status))
 
         status_sent = False
@@ -125,16 +145,33 @@ class RabbitmqCallStatus(StorageCallStatus):
             qname = 'lithops-{}'.format('-'.join(job_keys[0:k*3+3]))
             queues.append(qname)
 
-        while not status_sent and output_query_count < 5:
-            output_query_count = output_query_count + 1
-            try:
-                with self._create_channel() as ch:
+        try:
+            while not status_sent and output_query_count < 5:
+                output_query_count = output_query_count + 1
+                try:
+                    ch = self._get_channel()
                     for queue in queues:
                         ch.basic_publish(exchange='', routing_key=queue, body=dmpd_response_status)
-                logger.info("Execution status sent to RabbitMQ - Size: {}".format(drs))
-                status_sent = True
-            except Exception:
-                time.sleep(0.2)
+                    logger.info("Execution status sent to RabbitMQ - Size: {}".format(drs))
+                    status_sent = True
+                except Exception:
+                    self._close_connection()
+                    time.sleep(0.2)
+        finally:
+            self._close_connection()
+
+    def _send(self):
+        """
+        Send the status event to RabbitMQ
+        """
+        dmpd_response_status = json.dumps(self.status)
 
         if self.status['type'] == '__end__':
-            super()._send()
+            # Store the status in parallel, both use the same serialized data
+            with ThreadPoolExecutor(2) as ex:
+                fs = [ex.submit(self._publish, dmpd_response_status),
+                      ex.submit(self._store_status, dmpd_response_status)]
+                for f in fs:
+                    f.result()
+        else:
+            self._publish(dmpd_response_status)
@@ -19,7 +19,7 @@ import sys
 import pkgutil
 import logging
 import pickle
-import subprocess
+import socket
 from contextlib import contextmanager
 
 from lithops.version import __version__ as lithops_ver
@@ -140,22 +140,50 @@ def free_disk_space(dirname):
     return s.f_bsize * s.f_bavail
 
 
+_server_info = None
+
+
 def get_server_info():
     """
-    Returns server information
+    Returns server information. It doesn't change during the container
+    lifetime, so it is only computed on the first call
+    """
+    global _server_info
+    if _server_info is None:
+        _server_info = _compute_server_info()
+    return _server_info.copy()
+
+
+def _compute_server_info():
+    """
+    Reads the server information from the system
     """
-    container_name = subprocess.check_output("uname -n", shell=True).decode("ascii").strip()
-    ip_addr = subprocess.check_output("hostname -I", shell=True).decode("ascii").strip()
-    cores = subprocess.check_output("nproc", shell=True).decode("ascii").strip()
+    container_name = socket.gethostname()
+    try:
+        ip_addr = socket.gethostbyname(container_name)
+    except socket.error:
+        ip_addr = ''
 
-    cmd = "cat /sys/class/net/eth0/speed | awk '{print $0 / 1000\"GbE\"}'"
-    net_speed = subprocess.check_output(cmd, shell=True).decode("ascii").strip()
+    if hasattr(os, 'sched_getaffinity'):
+        cores = str(len(os.sched_getaffinity(0)))
+    else:
+        cores = str(os.cpu_count())
 
-    # cmd = "cat /sys/class/net/eth0/address"
-    # mac_address = subprocess.check_output(cmd, shell=True).decode("ascii").strip()
+    try:
+        with open('/sys/class/net/eth0/speed', 'r') as speed_file:
+            net_speed = '{:g}GbE'.format(int(speed_file.read().strip()) / 1000)
+    except (OSError, ValueError):
+        net_speed = ''
 
-    cmd = "grep MemTotal /proc/meminfo | awk '{print $2 / 1024 / 1024\"GB\"}'"
-    memory = subprocess.check_output(cmd, shell=True).decode("ascii").strip()
+    memory = ''
+    try:
+        with open('/proc/meminfo', 'r') as meminfo_file:
+            for line in meminfo_file:
+                if line.startswith('MemTotal'):
+                    memory = '{:g}GB'.format(int(line.split()[1]) / 1024 / 1024)
+                    break
+    except (OSError, ValueError):
+        pass
 
     server_info = {'container_name': container_name,
                    'ip_address': ip_addr,